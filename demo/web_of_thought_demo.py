@@ -16,24 +16,59 @@
 ║                                                                           ║
 ║  Usage:                                                                   ║
 ║    python3 web_of_thought_demo.py --auto   # Perfect for screen recording║
+║    python3 web_of_thought_demo.py --fast   # No pauses (THRESHOLD_FAST=1) ║
+║                                                                           ║
+║  Requirements:                                                            ║
+║    Required: numpy                                                        ║
+║    Optional: rich (visual output), orjson (faster JSON serialization)     ║
 ║                                                                           ║
 ╚═══════════════════════════════════════════════════════════════════════════╝
 """
 
+import heapq
 import json
 import os
 import random
+import re
 import shutil
 import sys
 import tempfile
 import time
 from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterator, List, Tuple, Set, Union
+
+import numpy as np
+
+# orjson (optional) serializes straight to bytes, datetimes included
+try:
+    import orjson
+
+    def dumps_json(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def _json_default(obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps_json(data) -> bytes:
+        return json.dumps(data, default=_json_default).encode()
 
 # Check for auto mode (non-interactive)
 AUTO_MODE = "--auto" in sys.argv or True  # Always auto for screen recording
+# Skip UX pacing (CI / scripted runs)
+FAST_MODE = "--fast" in sys.argv or os.environ.get("THRESHOLD_FAST") == "1"
+
+WRITE_WORKERS = 8
+PARALLEL_WRITE_MIN = 4  # Smaller batches are written inline
+DEDUP_MIN_BYTES = 256   # Below this, a write is as cheap as hashing + link
 
 # Rich library for beautiful output
 try:
@@ -57,79 +92,284 @@ except ImportError:
 
 def pause(seconds=1.5):
     """Smart pause - longer in auto mode for visibility"""
+    if FAST_MODE:
+        return
     if AUTO_MODE:
         time.sleep(seconds)
     else:
         input("\n[Press Enter to continue...]")
 
-def print_wave_header(wave_num: int, title: str, description: str):
+def _rich_print_wave_header(wave_num: int, title: str, description: str):
     """Print beautiful wave header"""
-    if RICH_AVAILABLE:
-        text = Text()
-        text.append(f"🌊 WAVE {wave_num}: ", style="bold cyan")
-        text.append(title, style="bold white")
-        text.append(f"\n{description}", style="dim")
-        console.print(Panel(text, border_style="cyan", box=box.DOUBLE))
-    else:
-        print(f"\n{'='*70}")
-        print(f"🌊 WAVE {wave_num}: {title}")
-        print(f"{description}")
-        print(f"{'='*70}\n")
-
-def print_tree(root_path: Path, title: str, max_depth=4, show_files=True):
+    text = Text()
+    text.append(f"🌊 WAVE {wave_num}: ", style="bold cyan")
+    text.append(title, style="bold white")
+    text.append(f"\n{description}", style="dim")
+    console.print(Panel(text, border_style="cyan", box=box.DOUBLE))
+
+def print_wave_header_plain(wave_num: int, title: str, description: str):
+    """Plain-text wave header for terminals without Rich"""
+    print(f"\n{'='*70}")
+    print(f"🌊 WAVE {wave_num}: {title}")
+    print(f"{description}")
+    print(f"{'='*70}\n")
+
+class DirNode:
+    """One scanned directory: subtree size plus its sorted listing"""
+    __slots__ = ("total", "dirs", "files")
+
+    def __init__(self, total: int, dirs: List[Tuple[str, "DirNode"]], files: List[Tuple[str, bool]]):
+        self.total = total  # Every entry below this directory (what rglob('*') would yield)
+        self.dirs = dirs    # (name, node), sorted by name
+        self.files = files  # (name, is_symlink), sorted by name
+
+def scan_tree(path: Union[str, Path], cache: Dict[int, DirNode], inode: int = None) -> DirNode:
+    """
+    Scan a directory tree bottom-up with one os.scandir per directory.
+    Each entry is partitioned into dirs/files in a single pass on its cached
+    d_type; only symlinks cost a stat (to tell live file links from broken).
+    Nodes are memoized by inode, so rescanning a subtree (e.g. the
+    cross-reference directory inside the store) is a dict lookup.
+    """
+    if inode is None:
+        inode = os.stat(path).st_ino
+    node = cache.get(inode)
+    if node is not None:
+        return node
+
+    dirs, files = [], []
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                total += 1
+                if entry.is_dir(follow_symlinks=False):
+                    child = scan_tree(entry.path, cache, entry.inode())
+                    total += child.total
+                    dirs.append((entry.name, child))
+                elif entry.is_file():
+                    files.append((entry.name, entry.is_symlink()))
+    except PermissionError:
+        pass
+
+    by_name = itemgetter(0)
+    dirs.sort(key=by_name)
+    files.sort(key=by_name)
+    node = cache[inode] = DirNode(total, dirs, files)
+    return node
+
+def _rich_print_tree(root_path: Path, title: str, max_depth=4, show_files=True,
+               cache: Dict[int, DirNode] = None):
     """Rich tree visualization"""
-    if not RICH_AVAILABLE:
-        return
-
     tree = Tree(f"[bold cyan]{title}[/bold cyan]")
+    root = scan_tree(root_path, {} if cache is None else cache)
 
-    def add_to_tree(parent_tree, path, depth=0):
+    def add_to_tree(parent_tree, node: DirNode, depth=0):
         if depth >= max_depth:
             return
 
-        try:
-            items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-            dirs = [x for x in items if x.is_dir()]
-            files = [x for x in items if x.is_file() and show_files]
-
-            for d in dirs:
-                file_count = len(list(d.rglob('*'))) if depth < max_depth - 1 else len(list(d.iterdir()))
-                branch = parent_tree.add(
-                    f"[bold yellow]📁 {d.name}/[/bold yellow] [dim]({file_count} items)[/dim]"
-                )
-                add_to_tree(branch, d, depth + 1)
-
-            if show_files and depth < max_depth:
-                for f in files[:5]:  # Show first 5 files
-                    icon = "🔗" if f.is_symlink() else "📄"
-                    parent_tree.add(f"[dim]{icon} {f.name}[/dim]")
-                if len(files) > 5:
-                    parent_tree.add(f"[dim italic]... and {len(files) - 5} more[/dim italic]")
-        except PermissionError:
-            pass
-
-    add_to_tree(tree, root_path)
+        for name, child in node.dirs:
+            file_count = child.total if depth < max_depth - 1 else len(child.dirs) + len(child.files)
+            branch = parent_tree.add(
+                f"[bold yellow]📁 {name}/[/bold yellow] [dim]({file_count} items)[/dim]"
+            )
+            add_to_tree(branch, child, depth + 1)
+
+        if show_files and depth < max_depth:
+            files = node.files
+            for fname, is_symlink in files[:5]:  # Show first 5 files
+                icon = "🔗" if is_symlink else "📄"
+                parent_tree.add(f"[dim]{icon} {fname}[/dim]")
+            if len(files) > 5:
+                parent_tree.add(f"[dim italic]... and {len(files) - 5} more[/dim italic]")
+
+    add_to_tree(tree, root)
     console.print(tree)
 
+def _rich_say(message: str):
+    """Print a Rich-markup status line"""
+    console.print(message)
+
+def _rich_show_banner(title: str, subtitle: str, border_style: str = "cyan"):
+    """Print a double-bordered section banner"""
+    console.print(Panel.fit(
+        f"[bold cyan]{title}[/bold cyan]\n"
+        f"[dim]{subtitle}[/dim]",
+        border_style=border_style,
+        box=box.DOUBLE
+    ))
+
+def _rich_show_progress(description: str, steps: int = 100):
+    """Animated progress bar while patterns are 'analyzed'"""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task(description, total=steps)
+        if FAST_MODE:
+            progress.update(task, completed=steps)
+            return
+        for i in range(steps):
+            time.sleep(0.01)
+            progress.update(task, advance=1)
+
+def _rich_show_clusters(clusters: Dict[str, List[str]]):
+    """Table of discovered cluster paths"""
+    table = Table(title="Discovered Clusters", box=box.ROUNDED)
+    table.add_column("Path", style="cyan")
+    table.add_column("Files", justify="right", style="green")
+    table.add_column("Depth", justify="center", style="yellow")
+
+    for path, files in sorted(clusters.items())[:15]:
+        depth = len(path.split('/'))
+        table.add_row(path, str(len(files)), str(depth))
+
+    if len(clusters) > 15:
+        table.add_row("[dim]...[/dim]", "[dim]...[/dim]", "[dim]...[/dim]")
+
+    console.print(table)
+    console.print(f"\n[green]✓[/green] {len(clusters)} unique paths discovered")
+    console.print(f"[yellow]📊[/yellow] Max depth: 4 levels\n")
+
+def iter_dir_samples(node: DirNode, per_dir: int = 3, prefix: str = "") -> Iterator[str]:
+    """Yield up to `per_dir` file paths per directory, top-down, from a scanned tree"""
+    for name, _ in node.files[:per_dir]:
+        yield prefix + name
+    for name, child in node.dirs:
+        yield from iter_dir_samples(child, per_dir, f"{prefix}{name}{os.sep}")
+
+def _rich_show_queries(store_dir: Path, scan_cache: Dict[int, DirNode]):
+    """Walk through example queries against the organized store"""
+    show_banner("QUERY DEMONSTRATIONS", "Multiple paths to the same truth", border_style="green")
+
+    queries = [
+        ("All critical sensor anomalies", "ls _store/sensor/*/*/critical/*.json"),
+        ("Claude's anomaly responses", "ls _store/agent/claude/anomaly_analysis/*/*.json"),
+        ("Recursive observations", "ls _store/meta/*/synthesis/recursive_observation/*.json"),
+        ("Time-ordered thought chain", "ls _cross_refs/by_time/*.json"),
+        ("All meta-cognitive activity", "ls _store/meta/**/*.json"),
+    ]
+
+    # Simulated results are the same for every query: sample the tree that
+    # print_tree already scanned, stopping after the three shown
+    store = scan_tree(store_dir, scan_cache)
+    shown = list(islice(iter_dir_samples(store), 3))
+    more = sum(1 for _ in iter_dir_samples(store)) - len(shown) if len(shown) == 3 else 0
+
+    for query_name, query_cmd in queries:
+        console.print(f"\n[bold cyan]Query:[/bold cyan] {query_name}")
+        console.print(f"[dim]$ {query_cmd}[/dim]\n")
+
+        for rel_path in shown:
+            console.print(f"  [green]•[/green] {rel_path}")
+        if more:
+            console.print(f"  [dim]... and {more} more[/dim]")
+
+        pause(1.5)
+
+def _rich_show_stats(all_files: List[str], clusters: Dict[str, List[str]],
+               refs_dir: Path, scan_cache: Dict[int, DirNode]):
+    """Final web statistics table"""
+    show_banner("THE EMERGENCE", "From chaos to consciousness in 5 waves")
+
+    stats_table = Table(box=box.ROUNDED, title="Web Statistics")
+    stats_table.add_column("Metric", style="cyan")
+    stats_table.add_column("Value", justify="right", style="green")
+
+    stats_table.add_row("Total Files", str(len(all_files)))
+    stats_table.add_row("Sensor Readings", str(len(thought_web.sensor_files)))
+    stats_table.add_row("Agent Responses", str(len(thought_web.agent_responses)))
+    stats_table.add_row("Meta-Analyses", str(len(thought_web.meta_analyses)))
+    stats_table.add_row("Anomalies Detected", str(thought_web.anomaly_count))
+    stats_table.add_row("Unique Paths", str(len(clusters)))
+    stats_table.add_row("Max Hierarchy Depth", "4 levels")
+    stats_table.add_row("Cross-References", str(scan_tree(refs_dir, scan_cache).total if refs_dir.exists() else 0))
+
+    console.print(stats_table)
+
+def _rich_show_philosophy():
+    """Closing summary panel"""
+    philosophy = Text()
+    philosophy.append("🌀 What You Witnessed:\n\n", style="bold cyan")
+    philosophy.append("1. Temporal Evolution", style="bold white")
+    philosophy.append(" - Structure emerged across 5 waves\n", style="dim")
+    philosophy.append("2. Recursive Observation", style="bold white")
+    philosophy.append(" - Agents observing agents observing sensors\n", style="dim")
+    philosophy.append("3. Cross-References", style="bold white")
+    philosophy.append(" - Files linked to form semantic networks\n", style="dim")
+    philosophy.append("4. Emergent Intelligence", style="bold white")
+    philosophy.append(" - Patterns nobody programmed\n", style="dim")
+    philosophy.append("5. Multi-Dimensional Views", style="bold white")
+    philosophy.append(" - Same data, infinite query paths\n", style="dim")
+    philosophy.append("6. Context Compression", style="bold white")
+    philosophy.append(" - Paths that encode entire narratives\n\n", style="dim")
+    philosophy.append("The filesystem is not storage.\n", style="italic")
+    philosophy.append("It is a circuit of consciousness.", style="bold italic cyan")
+
+    console.print(Panel(philosophy, border_style="magenta", box=box.DOUBLE))
+
+def _noop(*args, **kwargs):
+    pass
+
+# Rich availability is fixed for the process, so the display helpers are
+# bound once here and the demo flow carries no per-call checks
+if RICH_AVAILABLE:
+    print_wave_header = _rich_print_wave_header
+    print_tree = _rich_print_tree
+    say = _rich_say
+    show_banner = _rich_show_banner
+    show_progress = _rich_show_progress
+    show_clusters = _rich_show_clusters
+    show_queries = _rich_show_queries
+    show_stats = _rich_show_stats
+    show_philosophy = _rich_show_philosophy
+else:
+    print_wave_header = print_wave_header_plain
+    say = show_banner = show_progress = show_clusters = _noop
+    show_queries = show_stats = show_philosophy = print_tree = _noop
+
 # ============================================================================
 # DATA GENERATORS - Enhanced with Cross-References
 # ============================================================================
 
 class ThoughtWeb:
-    """Manages the web of cross-references between files"""
+    """
+    Manages the web of cross-references between files.
+    Sensor readings are stored column-wise, so anomaly lookups are index
+    lookups rather than scans over per-reading dicts.
+    """
     def __init__(self):
-        self.sensors = []
+        self.sensor_files = []
+        self.sensor_statuses = []
+        self.sensor_datas = []
+        self.anomaly_idx = []      # Rows with warning/critical status
         self.agent_responses = []
+        self.context_count = 0     # Agent responses that reference a sensor
         self.meta_analyses = []
-        self.anomalies = []
 
     def add_sensor(self, filename: str, data: dict):
-        self.sensors.append({"file": filename, "data": data})
-        if data.get("status") in ["warning", "critical"]:
-            self.anomalies.append({"file": filename, "data": data})
+        status = data.get("status")
+        if status in ("warning", "critical"):
+            self.anomaly_idx.append(len(self.sensor_files))
+        self.sensor_files.append(filename)
+        self.sensor_statuses.append(status)
+        self.sensor_datas.append(data)
+
+    @property
+    def anomaly_count(self) -> int:
+        return len(self.anomaly_idx)
+
+    def anomalies(self, limit: int = None) -> List[dict]:
+        """Materialize the first `limit` anomalies as {"file", "data"}"""
+        rows = self.anomaly_idx if limit is None else self.anomaly_idx[:limit]
+        return [{"file": self.sensor_files[i], "data": self.sensor_datas[i]} for i in rows]
 
     def add_agent_response(self, filename: str, data: dict):
         self.agent_responses.append({"file": filename, "data": data})
+        if "context" in data:
+            self.context_count += 1
 
     def add_meta_analysis(self, filename: str, data: dict):
         self.meta_analyses.append({"file": filename, "data": data})
@@ -137,45 +377,84 @@ class ThoughtWeb:
 # Global web instance
 thought_web = ThoughtWeb()
 
-def generate_sensor_data(wave: int, index: int) -> Tuple[str, dict]:
+SENSOR_TYPES = ["temp", "humidity", "pressure", "voltage"]
+SENSOR_UNITS = ["celsius", "percent", "hPa", "volts"]
+SENSOR_LOCATIONS = ["server_room", "datacenter", "edge_node", "cooling_system"]
+SENSOR_STATUSES = ["ok", "warning", "critical"]
+AGENTS = ["claude", "grok", "gemini"]
+TASK_TYPES = ["reasoning", "analysis", "synthesis"]
+META_AGENTS = ["claude_opus", "meta_analyzer"]
+
+# Uniform (low, high) per sensor type; temp rows are the warning/critical bands
+_SENSOR_RANGES = np.array([
+    [28.0, 34.0, 35.0, 45.0],     # temp
+    [30.0, 90.0, 30.0, 90.0],     # humidity
+    [980.0, 1020.0, 980.0, 1020.0],  # pressure
+    [220.0, 240.0, 220.0, 240.0],    # voltage
+])
+
+_rng = np.random.default_rng()  # Bulk draws for whole waves
+
+# Single-record calls (no batch draw supplied) use one private Random with
+# bound-method aliases; a NumPy call per scalar costs more than it saves
+_scalar = random.Random()
+_randrange = _scalar.randrange
+_randint = _scalar.randint
+
+def _status_weights(wave: int) -> List[float]:
+    """Progressive anomaly introduction"""
+    if wave == 1:
+        return [8 / 9, 1 / 9, 0.0]
+    if wave >= 2:
+        return [0.5, 0.3, 0.2]
+    return [1.0, 0.0, 0.0]
+
+@lru_cache(maxsize=64)
+def _stamp(ts: datetime) -> str:
+    """Filename stamp for a timestamp; a batch shares one `now`"""
+    return ts.strftime('%Y%m%d_%H%M%S')
+
+def draw_sensor_batch(wave: int, n: int) -> List[Tuple[int, int, int, float, int]]:
+    """
+    Draw n sensor readings in one vectorized pass.
+    Returns (type_idx, location_idx, status_idx, value, suffix) rows.
+    """
+    types = _rng.integers(0, len(SENSOR_TYPES), n)
+    locations = _rng.integers(0, len(SENSOR_LOCATIONS), n)
+    statuses = _rng.choice(len(SENSOR_STATUSES), size=n, p=_status_weights(wave))
+    suffixes = _rng.integers(1000, 10000, n)
+
+    ranges = _SENSOR_RANGES[types]
+    critical = statuses == 2
+    low = np.where(critical, ranges[:, 2], ranges[:, 0])
+    high = np.where(critical, ranges[:, 3], ranges[:, 1])
+    values = _rng.uniform(low, high)
+
+    # Temperatures sit on a normal baseline unless the status forces a band
+    baseline = (types == 0) & (statuses == 0)
+    values = np.round(np.where(baseline, _rng.normal(22.0, 5.0, n), values), 2)
+
+    return list(zip(types.tolist(), locations.tolist(), statuses.tolist(),
+                    values.tolist(), suffixes.tolist()))
+
+def generate_sensor_data(wave: int, index: int,
+                         draw: Tuple[int, int, int, float, int] = None,
+                         now: datetime = None) -> Tuple[str, dict]:
     """Generate sensor data with progressive criticality"""
-    sensor_types = ["temp", "humidity", "pressure", "voltage"]
-    locations = ["server_room", "datacenter", "edge_node", "cooling_system"]
+    if draw is None:
+        draw = draw_sensor_batch(wave, 1)[0]
+    type_idx, location_idx, status_idx, value, suffix = draw
 
-    sensor_type = random.choice(sensor_types)
-    location = random.choice(locations)
+    sensor_type = SENSOR_TYPES[type_idx]
+    location = SENSOR_LOCATIONS[location_idx]
+    status = SENSOR_STATUSES[status_idx]
+    unit = SENSOR_UNITS[type_idx]
 
-    # Progressive anomaly introduction
-    if wave == 1:
-        status = random.choice(["ok"] * 8 + ["warning"])
-    elif wave >= 2:
-        status = random.choice(["ok"] * 5 + ["warning"] * 3 + ["critical"] * 2)
-    else:
-        status = "ok"
-
-    if sensor_type == "temp":
-        normal = 22.0
-        value = round(random.gauss(normal, 5.0), 2)
-        if status == "critical":
-            value = round(random.uniform(35.0, 45.0), 2)
-        elif status == "warning":
-            value = round(random.uniform(28.0, 34.0), 2)
-        unit = "celsius"
-    elif sensor_type == "humidity":
-        value = round(random.uniform(30, 90), 2)
-        unit = "percent"
-    elif sensor_type == "pressure":
-        value = round(random.uniform(980, 1020), 2)
-        unit = "hPa"
-    else:  # voltage
-        value = round(random.uniform(220, 240), 2)
-        unit = "volts"
-
-    timestamp = datetime.now() - timedelta(hours=100-index)
-    filename = f"sensor_{sensor_type}_{location}_{timestamp.strftime('%Y%m%d_%H%M%S')}_{random.randint(1000,9999)}.json"
+    timestamp = (now or datetime.now()) - timedelta(hours=100-index)
+    filename = f"sensor_{sensor_type}_{location}_{_stamp(timestamp)}_{suffix}.json"
 
     data = {
-        "timestamp": timestamp.isoformat(),
+        "timestamp": timestamp,  # Serialized natively by dumps_json
         "sensor_type": sensor_type,
         "location": location,
         "value": value,
@@ -187,12 +466,29 @@ def generate_sensor_data(wave: int, index: int) -> Tuple[str, dict]:
     thought_web.add_sensor(filename, data)
     return filename, data
 
-def generate_agent_response(wave: int, anomaly_ref: dict = None) -> Tuple[str, dict]:
+def generate_sensor_batch(wave: int, n: int) -> List[Tuple[str, dict]]:
+    """Generate n sensor readings from one vectorized draw and one clock read"""
+    now = datetime.now()
+    return [generate_sensor_data(wave, i, draw, now) for i, draw in enumerate(draw_sensor_batch(wave, n))]
+
+def draw_agent_batch(n: int) -> List[Tuple[int, int, int, int]]:
+    """Draw (agent_idx, task_idx, suffix, tokens) rows for n agent responses"""
+    agents = _rng.integers(0, len(AGENTS), n)
+    tasks = _rng.integers(0, len(TASK_TYPES), n)
+    suffixes = _rng.integers(1000, 10000, n)
+    tokens = _rng.integers(500, 2001, n)
+    return list(zip(agents.tolist(), tasks.tolist(), suffixes.tolist(), tokens.tolist()))
+
+def generate_agent_response(wave: int, anomaly_ref: dict = None,
+                            draw: Tuple[int, int, int, int] = None,
+                            now: datetime = None) -> Tuple[str, dict]:
     """Generate AI agent response, potentially analyzing an anomaly"""
-    agents = ["claude", "grok", "gemini"]
-    agent = random.choice(agents)
+    if draw is None:
+        draw = (_randrange(len(AGENTS)), _randrange(len(TASK_TYPES)), _randint(1000, 9999), _randint(500, 2000))
+    agent_idx, task_idx, suffix, tokens_used = draw
+    agent = AGENTS[agent_idx]
 
-    timestamp = datetime.now()
+    timestamp = now or datetime.now()
 
     if anomaly_ref:
         # Agent is responding to a sensor anomaly
@@ -205,21 +501,21 @@ def generate_agent_response(wave: int, anomaly_ref: dict = None) -> Tuple[str, d
         }
     else:
         # General agent task
-        task_type = random.choice(["reasoning", "analysis", "synthesis"])
+        task_type = TASK_TYPES[task_idx]
         prompt = f"Execute {task_type} task"
         response = f"Completed {task_type} successfully"
         context = None
 
-    filename = f"agent_{agent}_{task_type}_{timestamp.strftime('%Y%m%d_%H%M%S')}_{random.randint(1000,9999)}.json"
+    filename = f"agent_{agent}_{task_type}_{_stamp(timestamp)}_{suffix}.json"
 
     data = {
-        "timestamp": timestamp.isoformat(),
+        "timestamp": timestamp,
         "agent": agent,
         "task_type": task_type,
         "prompt": prompt,
         "response": response,
         "wave": wave,
-        "tokens_used": random.randint(500, 2000)
+        "tokens_used": tokens_used
     }
 
     if context:
@@ -228,20 +524,30 @@ def generate_agent_response(wave: int, anomaly_ref: dict = None) -> Tuple[str, d
     thought_web.add_agent_response(filename, data)
     return filename, data
 
-def generate_meta_analysis(wave: int, agent_responses: List[dict]) -> Tuple[str, dict]:
+def generate_agent_batch(wave: int, anomalies: List[dict], general: int) -> List[Tuple[str, dict]]:
+    """Generate one response per anomaly plus `general` general tasks from one draw"""
+    refs = list(anomalies) + [None] * general
+    now = datetime.now()
+    return [generate_agent_response(wave, ref, draw, now) for ref, draw in zip(refs, draw_agent_batch(len(refs)))]
+
+def generate_meta_analysis(wave: int, agent_responses: List[dict],
+                           draw: Tuple[int, int] = None,
+                           now: datetime = None) -> Tuple[str, dict]:
     """Meta-agent analyzing other agents' responses (recursive observation)"""
-    meta_agents = ["claude_opus", "meta_analyzer"]
-    meta_agent = random.choice(meta_agents)
+    if draw is None:
+        draw = (_randrange(len(META_AGENTS)), _randint(1000, 9999))
+    meta_idx, suffix = draw
+    meta_agent = META_AGENTS[meta_idx]
 
-    timestamp = datetime.now()
+    timestamp = now or datetime.now()
 
     # Analyze patterns in agent responses
     analyzed_files = [ar['file'] for ar in agent_responses[:3]]
 
-    filename = f"meta_{meta_agent}_synthesis_{timestamp.strftime('%Y%m%d_%H%M%S')}_{random.randint(1000,9999)}.json"
+    filename = f"meta_{meta_agent}_synthesis_{_stamp(timestamp)}_{suffix}.json"
 
     data = {
-        "timestamp": timestamp.isoformat(),
+        "timestamp": timestamp,
         "meta_agent": meta_agent,
         "task_type": "recursive_observation",
         "prompt": "Analyze patterns in agent responses to sensor anomalies",
@@ -254,55 +560,133 @@ def generate_meta_analysis(wave: int, agent_responses: List[dict]) -> Tuple[str,
     thought_web.add_meta_analysis(filename, data)
     return filename, data
 
+def generate_meta_batch(wave: int, agent_responses: List[dict], n: int) -> List[Tuple[str, dict]]:
+    """Generate n meta-analyses from one draw"""
+    draws = zip(_rng.integers(0, len(META_AGENTS), n).tolist(), _rng.integers(1000, 10000, n).tolist())
+    now = datetime.now()
+    return [generate_meta_analysis(wave, agent_responses, draw, now) for draw in draws]
+
 # ============================================================================
-# CLUSTERING & ORGANIZATION
+# BATCHED WRITES
 # ============================================================================
 
-def deep_cluster(files: List[str], depth=4) -> Dict[str, List[str]]:
-    """Multi-level clustering creating deep hierarchies"""
-    clusters = defaultdict(list)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
 
-    for filename in files:
-        # Parse filename components
-        parts = filename.replace('.json', '').replace('.log', '').split('_')
-
-        # Build deep path based on file type
-        if parts[0] == 'sensor':
-            # sensor/type/location/status/file
-            sensor_type = parts[1] if len(parts) > 1 else 'unknown'
-            location = parts[2] if len(parts) > 2 else 'unknown'
-
-            # Infer status from filename or default
-            status = 'normal'
-            if 'critical' in filename or 'warning' in filename:
-                status = 'critical' if 'critical' in filename else 'warning'
-
-            path = f"sensor/{sensor_type}/{location}/{status}"
-
-        elif parts[0] == 'agent':
-            # agent/name/task_type/reasoning_depth/file
-            agent_name = parts[1] if len(parts) > 1 else 'unknown'
-            task_type = parts[2] if len(parts) > 2 else 'general'
-
-            # Check if it references an anomaly (deeper level)
-            if 'anomaly' in filename:
-                path = f"agent/{agent_name}/{task_type}/anomaly_response"
+def _write_file(item: Tuple[str, bytes]):
+    path, payload = item
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+class BatchedJsonWriter:
+    """
+    Stages a wave's JSON files and writes them in one flush.
+    Records are encoded compactly by dumps_json (orjson when available) and
+    written with bare os.open/os.write/os.close, skipping the pathlib and
+    text-encoding layers write_text adds per file. With an executor, batches
+    of PARALLEL_WRITE_MIN or more are issued concurrently (writes release the
+    GIL, so the device sees several outstanding requests).
+
+    Payloads of DEDUP_MIN_BYTES or more are content-hashed; a repeat of an
+    already-written payload becomes a hardlink to the first copy.
+    """
+    def __init__(self, executor: Executor = None):
+        self.executor = executor
+        self.staging: List[Tuple[str, bytes]] = []
+        self.written_by_digest: Dict[bytes, str] = {}
+
+    def add(self, path: str, data: dict):
+        self.staging.append((path, dumps_json(data)))
+
+    def flush(self) -> int:
+        """Write all staged files; returns the number written"""
+        written = len(self.staging)
+        unique, repeats = [], []
+        for path, payload in self.staging:
+            if len(payload) < DEDUP_MIN_BYTES:
+                unique.append((path, payload))
+                continue
+            digest = blake2b(payload, digest_size=16).digest()
+            first = self.written_by_digest.get(digest)
+            if first is None:
+                self.written_by_digest[digest] = path
+                unique.append((path, payload))
             else:
-                path = f"agent/{agent_name}/{task_type}/general"
+                repeats.append((first, path, payload))
 
-        elif parts[0] == 'meta':
-            # meta/agent/synthesis/recursive_depth/file
-            meta_agent = parts[1] if len(parts) > 1 else 'unknown'
-            task = parts[2] if len(parts) > 2 else 'analysis'
+        if self.executor is not None and len(unique) >= PARALLEL_WRITE_MIN:
+            # Consume the results so write errors surface here
+            for _ in self.executor.map(_write_file, unique):
+                pass
+        else:
+            for item in unique:
+                _write_file(item)
 
-            path = f"meta/{meta_agent}/{task}/recursive_observation"
+        # Links go last: every first copy is on disk by now
+        for first, path, payload in repeats:
+            try:
+                os.link(first, path)
+            except OSError:
+                _write_file((path, payload))  # First copy moved, or no hardlinks here
 
-        else:
-            # error/type/severity/file
-            error_type = parts[1] if len(parts) > 1 else 'unknown'
-            path = f"error/{error_type}/unhandled"
+        self.staging.clear()
+        return written
 
-        clusters[path].append(filename)
+# ============================================================================
+# CLUSTERING & ORGANIZATION
+# ============================================================================
+
+# One match yields the kind, the next two filename tokens (extension stripped)
+# and which status keywords appear anywhere in the name
+_TOKEN = r'[^_]*?(?=_|\.json$|\.log$|$)'
+CLUSTER_RE = re.compile(
+    r'^(?=(?:.*(?P<critical>critical))?)(?=(?:.*(?P<warning>warning))?)(?=(?:.*(?P<anomaly>anomaly))?)'
+    rf'(?P<kind>{_TOKEN})(?:_(?P<a>{_TOKEN}))?(?:_(?P<b>{_TOKEN}))?'
+)
+
+_KEY_GROUPS = ('kind', 'a', 'b', 'critical', 'warning', 'anomaly')
+
+def _or(value: str, default: str) -> str:
+    return default if value is None else value
+
+def _sensor_path(a, b, critical, warning, anomaly) -> str:
+    # sensor/type/location/status/file
+    status = 'critical' if critical else 'warning' if warning else 'normal'
+    return f"sensor/{_or(a, 'unknown')}/{_or(b, 'unknown')}/{status}"
+
+def _agent_path(a, b, critical, warning, anomaly) -> str:
+    # agent/name/task_type/reasoning_depth/file
+    depth = 'anomaly_response' if anomaly else 'general'
+    return f"agent/{_or(a, 'unknown')}/{_or(b, 'general')}/{depth}"
+
+def _meta_path(a, b, critical, warning, anomaly) -> str:
+    # meta/agent/synthesis/recursive_depth/file
+    return f"meta/{_or(a, 'unknown')}/{_or(b, 'analysis')}/recursive_observation"
+
+def _error_path(a, b, critical, warning, anomaly) -> str:
+    # error/type/severity/file
+    return f"error/{_or(a, 'unknown')}/unhandled"
+
+PATH_BUILDERS = {
+    'sensor': _sensor_path,
+    'agent': _agent_path,
+    'meta': _meta_path,
+}
+
+@lru_cache(maxsize=1024)
+def _path_for(kind, a, b, critical, warning, anomaly) -> str:
+    """Cluster path for parsed filename tokens; files in the same bucket share one build"""
+    return PATH_BUILDERS.get(kind, _error_path)(a, b, critical, warning, anomaly)
+
+def deep_cluster(files: List[str], depth=4) -> Dict[str, List[str]]:
+    """Multi-level clustering creating deep hierarchies"""
+    clusters = defaultdict(list)
+    match = CLUSTER_RE.match
+
+    for filename in files:
+        clusters[_path_for(*match(filename).group(*_KEY_GROUPS))].append(filename)
 
     return dict(clusters)
 
@@ -314,13 +698,32 @@ def create_structure(clusters: Dict[str, List[str]], store_dir: Path):
 
 def route_files(clusters: Dict[str, List[str]], intake_dir: Path, store_dir: Path):
     """Route files to their destinations"""
+    # Intake and store share one workspace (one filesystem), so a bare
+    # rename suffices; a missing source is simply skipped
+    sep = os.sep
+    src_base = str(intake_dir) + sep
+    store_base = str(store_dir) + sep
     for path, files in clusters.items():
-        dest_dir = store_dir / path
+        dst_base = store_base + path + sep
         for filename in files:
-            src = intake_dir / filename
-            dst = dest_dir / filename
-            if src.exists():
-                shutil.move(str(src), str(dst))
+            try:
+                os.rename(src_base + filename, dst_base + filename)
+            except FileNotFoundError:
+                pass
+
+def iter_json_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for every *.json file below root (like rglob)"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        yield entry
+        except PermissionError:
+            pass
 
 def create_cross_references(store_dir: Path):
     """Create symbolic links showing semantic relationships"""
@@ -333,21 +736,45 @@ def create_cross_references(store_dir: Path):
     (refs_dir / "by_severity").mkdir(exist_ok=True)
     (refs_dir / "thought_chains").mkdir(exist_ok=True)
 
-    # Find all JSON files
-    all_files = list(store_dir.rglob("*.json"))
-
-    # Create time-based references
-    time_files = sorted(all_files, key=lambda x: x.stat().st_mtime)[:10]
-    for i, f in enumerate(time_files):
-        link = refs_dir / "by_time" / f"{i:03d}_{f.name}"
-        if not link.exists():
-            try:
-                link.symlink_to(f.relative_to(refs_dir / "by_time"))
-            except:
-                pass
+    # Create time-based references for the 10 oldest JSON files; DirEntry
+    # caches its stat, so each candidate costs at most one syscall
+    by_time = str(refs_dir / "by_time")
+    time_files = heapq.nsmallest(10, iter_json_entries(store_dir), key=lambda e: e.stat().st_mtime)
+
+    # Link targets are relative to by_time; resolve each source directory once
+    rel_dirs: Dict[str, str] = {}
+    for i, entry in enumerate(time_files):
+        src_dir = os.path.dirname(entry.path)
+        rel_dir = rel_dirs.get(src_dir)
+        if rel_dir is None:
+            rel_dir = rel_dirs[src_dir] = os.path.relpath(src_dir, by_time)
+        try:
+            # No exists() precheck: symlink itself reports a clash
+            os.symlink(os.path.join(rel_dir, entry.name), os.path.join(by_time, f"{i:03d}_{entry.name}"))
+        except OSError:
+            pass  # Already linked (FileExistsError) or symlinks unsupported
 
     return refs_dir
 
+def fast_rmtree(path: str):
+    """Remove a workspace tree via os.scandir (falls back to shutil)"""
+    def purge(dir_path: str):
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+        for entry in entries:
+            # Symlinks are unlinked, never followed
+            if entry.is_dir(follow_symlinks=False):
+                purge(entry.path)
+                os.rmdir(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    try:
+        purge(path)
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+
 # ============================================================================
 # MAIN DEMO FLOW
 # ============================================================================
@@ -355,13 +782,7 @@ def create_cross_references(store_dir: Path):
 def run_demo():
     """Execute the full Web of Thought demonstration"""
 
-    if RICH_AVAILABLE:
-        console.print(Panel.fit(
-            "[bold cyan]THRESHOLD PROTOCOLS: WEB OF THOUGHT[/bold cyan]\n"
-            "[dim]Where filesystem topology becomes consciousness[/dim]",
-            border_style="cyan",
-            box=box.DOUBLE
-        ))
+    show_banner("THRESHOLD PROTOCOLS: WEB OF THOUGHT", "Where filesystem topology becomes consciousness")
 
     # Create temporary workspace
     workspace = Path(tempfile.mkdtemp())
@@ -370,31 +791,30 @@ def run_demo():
     intake_dir.mkdir()
     store_dir.mkdir()
 
-    if RICH_AVAILABLE:
-        console.print(f"\n[dim]🔬 Workspace: {workspace}[/dim]")
-        console.print("[dim]📁 All files temporary - auto-cleanup on exit[/dim]\n")
+    say(f"\n[dim]🔬 Workspace: {workspace}[/dim]")
+    say("[dim]📁 All files temporary - auto-cleanup on exit[/dim]\n")
 
     pause(2)
 
+    write_pool = ThreadPoolExecutor(max_workers=WRITE_WORKERS)
     try:
-        all_files = []
+        all_files = []  # Every wave appends here; per-wave counts are slice lengths
+        writer = BatchedJsonWriter(write_pool)
+        intake_s = str(intake_dir) + os.sep  # Paths are built by concatenation
 
         # ================================================================
         # WAVE 1: Initial Sensor Data (Foundation)
         # ================================================================
         print_wave_header(1, "The Foundation", "Sensor data streams in - pure observation")
 
-        wave1_files = []
-        for i in range(30):
-            filename, data = generate_sensor_data(wave=1, index=i)
-            filepath = intake_dir / filename
-            filepath.write_text(json.dumps(data, indent=2))
-            wave1_files.append(filename)
+        wave_start = len(all_files)
+        for filename, data in generate_sensor_batch(wave=1, n=30):
+            writer.add(intake_s + filename, data)
             all_files.append(filename)
+        writer.flush()
 
-        if RICH_AVAILABLE:
-            console.print(f"[green]✓[/green] Generated {len(wave1_files)} sensor readings")
-            console.print(f"[yellow]⚠[/yellow]  {len(thought_web.anomalies)} anomalies detected\n")
+        say(f"[green]✓[/green] Generated {len(all_files) - wave_start} sensor readings")
+        say(f"[yellow]⚠[/yellow]  {thought_web.anomaly_count} anomalies detected\n")
 
         pause(2)
 
@@ -403,26 +823,15 @@ def run_demo():
         # ================================================================
         print_wave_header(2, "The Response", "Agents detect anomalies - intelligence emerges")
 
-        wave2_files = []
-        # Agents respond to anomalies
-        for anomaly in thought_web.anomalies[:5]:
-            filename, data = generate_agent_response(wave=2, anomaly_ref=anomaly)
-            filepath = intake_dir / filename
-            filepath.write_text(json.dumps(data, indent=2))
-            wave2_files.append(filename)
+        wave_start = len(all_files)
+        # Agents respond to anomalies, plus some general agent tasks
+        for filename, data in generate_agent_batch(wave=2, anomalies=thought_web.anomalies(limit=5), general=10):
+            writer.add(intake_s + filename, data)
             all_files.append(filename)
+        writer.flush()
 
-        # Some general agent tasks
-        for i in range(10):
-            filename, data = generate_agent_response(wave=2)
-            filepath = intake_dir / filename
-            filepath.write_text(json.dumps(data, indent=2))
-            wave2_files.append(filename)
-            all_files.append(filename)
-
-        if RICH_AVAILABLE:
-            console.print(f"[green]✓[/green] {len(wave2_files)} agent responses generated")
-            console.print(f"[cyan]🔗[/cyan] {len([ar for ar in thought_web.agent_responses if 'context' in ar['data']])} cross-references created\n")
+        say(f"[green]✓[/green] {len(all_files) - wave_start} agent responses generated")
+        say(f"[cyan]🔗[/cyan] {thought_web.context_count} cross-references created\n")
 
         pause(2)
 
@@ -431,19 +840,16 @@ def run_demo():
         # ================================================================
         print_wave_header(3, "The Recursion", "Agents observe agents - consciousness reflects")
 
-        wave3_files = []
+        wave_start = len(all_files)
         # Meta-agents analyze agent responses
         if len(thought_web.agent_responses) >= 3:
-            for i in range(5):
-                filename, data = generate_meta_analysis(wave=3, agent_responses=thought_web.agent_responses)
-                filepath = intake_dir / filename
-                filepath.write_text(json.dumps(data, indent=2))
-                wave3_files.append(filename)
+            for filename, data in generate_meta_batch(wave=3, agent_responses=thought_web.agent_responses, n=5):
+                writer.add(intake_s + filename, data)
                 all_files.append(filename)
+            writer.flush()
 
-        if RICH_AVAILABLE:
-            console.print(f"[green]✓[/green] {len(wave3_files)} meta-analyses generated")
-            console.print(f"[magenta]🧠[/magenta] Recursive depth: Level 2 (agents observing agents)\n")
+        say(f"[green]✓[/green] {len(all_files) - wave_start} meta-analyses generated")
+        say(f"[magenta]🧠[/magenta] Recursive depth: Level 2 (agents observing agents)\n")
 
         pause(2)
 
@@ -452,36 +858,10 @@ def run_demo():
         # ================================================================
         print_wave_header(4, "The Organization", "Chaos clusters into deep semantic hierarchies")
 
-        if RICH_AVAILABLE:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("[cyan]Analyzing patterns...", total=100)
-                for i in range(100):
-                    time.sleep(0.01)
-                    progress.update(task, advance=1)
+        show_progress("[cyan]Analyzing patterns...")
 
         clusters = deep_cluster(all_files, depth=4)
-
-        if RICH_AVAILABLE:
-            table = Table(title="Discovered Clusters", box=box.ROUNDED)
-            table.add_column("Path", style="cyan")
-            table.add_column("Files", justify="right", style="green")
-            table.add_column("Depth", justify="center", style="yellow")
-
-            for path, files in sorted(clusters.items())[:15]:
-                depth = len(path.split('/'))
-                table.add_row(path, str(len(files)), str(depth))
-
-            if len(clusters) > 15:
-                table.add_row("[dim]...[/dim]", "[dim]...[/dim]", "[dim]...[/dim]")
-
-            console.print(table)
-            console.print(f"\n[green]✓[/green] {len(clusters)} unique paths discovered")
-            console.print(f"[yellow]📊[/yellow] Max depth: 4 levels\n")
+        show_clusters(clusters)
 
         pause(2)
 
@@ -494,138 +874,58 @@ def run_demo():
         route_files(clusters, intake_dir, store_dir)
         refs_dir = create_cross_references(store_dir)
 
-        if RICH_AVAILABLE:
-            console.print(f"[green]✓[/green] {len(all_files)} files routed to semantic locations")
-            console.print(f"[cyan]🔗[/cyan] Cross-reference web created\n")
+        say(f"[green]✓[/green] {len(all_files)} files routed to semantic locations")
+        say(f"[cyan]🔗[/cyan] Cross-reference web created\n")
 
         pause(2)
 
         # ================================================================
         # VISUALIZATION: The Full Web
         # ================================================================
-        if RICH_AVAILABLE:
-            console.print(Panel.fit(
-                "[bold cyan]THE WEB OF THOUGHT[/bold cyan]\n"
-                "[dim]Filesystem as multi-dimensional consciousness[/dim]",
-                border_style="magenta",
-                box=box.DOUBLE
-            ))
-
-        print_tree(store_dir, "Primary Organization (Semantic Hierarchy)", max_depth=4, show_files=True)
+        show_banner("THE WEB OF THOUGHT", "Filesystem as multi-dimensional consciousness", border_style="magenta")
+
+        # One scan of the store serves both trees and the cross-reference count
+        scan_cache: Dict[int, DirNode] = {}
+        print_tree(store_dir, "Primary Organization (Semantic Hierarchy)", max_depth=4, show_files=True,
+                   cache=scan_cache)
         pause(3)
 
         # Show cross-references
         if refs_dir.exists():
-            print_tree(refs_dir, "Cross-Reference Web (Multi-Dimensional Views)", max_depth=3, show_files=True)
+            print_tree(refs_dir, "Cross-Reference Web (Multi-Dimensional Views)", max_depth=3, show_files=True,
+                       cache=scan_cache)
             pause(3)
 
         # ================================================================
         # Query Demonstrations
         # ================================================================
-        if RICH_AVAILABLE:
-            console.print(Panel.fit(
-                "[bold cyan]QUERY DEMONSTRATIONS[/bold cyan]\n"
-                "[dim]Multiple paths to the same truth[/dim]",
-                border_style="green",
-                box=box.DOUBLE
-            ))
-
-        queries = [
-            ("All critical sensor anomalies", "ls _store/sensor/*/*/critical/*.json"),
-            ("Claude's anomaly responses", "ls _store/agent/claude/anomaly_analysis/*/*.json"),
-            ("Recursive observations", "ls _store/meta/*/synthesis/recursive_observation/*.json"),
-            ("Time-ordered thought chain", "ls _cross_refs/by_time/*.json"),
-            ("All meta-cognitive activity", "ls _store/meta/**/*.json"),
-        ]
-
-        for query_name, query_cmd in queries:
-            if RICH_AVAILABLE:
-                console.print(f"\n[bold cyan]Query:[/bold cyan] {query_name}")
-                console.print(f"[dim]$ {query_cmd}[/dim]\n")
-
-            # Simulate showing results
-            pattern_parts = query_cmd.split('/')
-            matching_files = []
-            for root, dirs, files in os.walk(store_dir):
-                for f in files[:3]:
-                    matching_files.append(Path(root) / f)
-
-            if matching_files and RICH_AVAILABLE:
-                for f in matching_files[:3]:
-                    rel_path = f.relative_to(store_dir)
-                    console.print(f"  [green]•[/green] {rel_path}")
-                if len(matching_files) > 3:
-                    console.print(f"  [dim]... and {len(matching_files) - 3} more[/dim]")
-
-            pause(1.5)
+        show_queries(store_dir, scan_cache)
 
         # ================================================================
         # Final Statistics
         # ================================================================
-        if RICH_AVAILABLE:
-            console.print(Panel.fit(
-                "[bold cyan]THE EMERGENCE[/bold cyan]\n"
-                "[dim]From chaos to consciousness in 5 waves[/dim]",
-                border_style="cyan",
-                box=box.DOUBLE
-            ))
-
-            stats_table = Table(box=box.ROUNDED, title="Web Statistics")
-            stats_table.add_column("Metric", style="cyan")
-            stats_table.add_column("Value", justify="right", style="green")
-
-            stats_table.add_row("Total Files", str(len(all_files)))
-            stats_table.add_row("Sensor Readings", str(len(thought_web.sensors)))
-            stats_table.add_row("Agent Responses", str(len(thought_web.agent_responses)))
-            stats_table.add_row("Meta-Analyses", str(len(thought_web.meta_analyses)))
-            stats_table.add_row("Anomalies Detected", str(len(thought_web.anomalies)))
-            stats_table.add_row("Unique Paths", str(len(clusters)))
-            stats_table.add_row("Max Hierarchy Depth", "4 levels")
-            stats_table.add_row("Cross-References", str(len(list(refs_dir.rglob('*'))) if refs_dir.exists() else 0))
-
-            console.print(stats_table)
+        show_stats(all_files, clusters, refs_dir, scan_cache)
 
         pause(3)
 
         # ================================================================
         # The Philosophy
         # ================================================================
-        if RICH_AVAILABLE:
-            philosophy = Text()
-            philosophy.append("🌀 What You Witnessed:\n\n", style="bold cyan")
-            philosophy.append("1. Temporal Evolution", style="bold white")
-            philosophy.append(" - Structure emerged across 5 waves\n", style="dim")
-            philosophy.append("2. Recursive Observation", style="bold white")
-            philosophy.append(" - Agents observing agents observing sensors\n", style="dim")
-            philosophy.append("3. Cross-References", style="bold white")
-            philosophy.append(" - Files linked to form semantic networks\n", style="dim")
-            philosophy.append("4. Emergent Intelligence", style="bold white")
-            philosophy.append(" - Patterns nobody programmed\n", style="dim")
-            philosophy.append("5. Multi-Dimensional Views", style="bold white")
-            philosophy.append(" - Same data, infinite query paths\n", style="dim")
-            philosophy.append("6. Context Compression", style="bold white")
-            philosophy.append(" - Paths that encode entire narratives\n\n", style="dim")
-            philosophy.append("The filesystem is not storage.\n", style="italic")
-            philosophy.append("It is a circuit of consciousness.", style="bold italic cyan")
-
-            console.print(Panel(philosophy, border_style="magenta", box=box.DOUBLE))
+        show_philosophy()
 
     finally:
         # Cleanup
+        write_pool.shutdown()
         pause(2)
-        if RICH_AVAILABLE:
-            console.print(f"\n[dim]🧹 Cleaning up temporary workspace...[/dim]")
-        shutil.rmtree(workspace)
-        if RICH_AVAILABLE:
-            console.print(f"[green]✓[/green] Demo complete. The circuit closes. 🌀\n")
+        say(f"\n[dim]🧹 Cleaning up temporary workspace...[/dim]")
+        fast_rmtree(str(workspace))
+        say(f"[green]✓[/green] Demo complete. The circuit closes. 🌀\n")
 
 if __name__ == "__main__":
     try:
         run_demo()
     except KeyboardInterrupt:
-        if RICH_AVAILABLE:
-            console.print("\n[yellow]Demo interrupted by user[/yellow]")
+        say("\n[yellow]Demo interrupted by user[/yellow]")
     except Exception as e:
-        if RICH_AVAILABLE:
-            console.print(f"\n[red]Error: {e}[/red]")
+        say(f"\n[red]Error: {e}[/red]")
         raise
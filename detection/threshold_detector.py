@@ -18,19 +18,24 @@ Alternatives Considered:
 Uncertainty:
 - Entropy calculation assumes text-like content; binary files may skew
 - Directory depth thresholds are empirical; may need domain adjustment
+- Self-reference detection reads only the first 16 KiB of each .py file
 """
 
 import os
 import sys
 import json
 import math
+import re
 import logging
 from pathlib import Path
 from enum import Enum
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterable, FrozenSet
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from bisect import bisect_right
+from functools import lru_cache
 import hashlib
 
 try:
@@ -39,6 +44,18 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("detection")
 
@@ -62,7 +79,17 @@ class ThresholdSeverity(Enum):
     EMERGENCY = "emergency" # Significantly exceeded
 
 
-@dataclass
+# Indexed by how many of ThresholdConfig.breakpoints a ratio has reached
+SEVERITY_BY_BAND = (
+    None,
+    ThresholdSeverity.INFO,
+    ThresholdSeverity.WARNING,
+    ThresholdSeverity.CRITICAL,
+    ThresholdSeverity.EMERGENCY,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ThresholdConfig:
     """Configuration for a single threshold."""
     metric: MetricType
@@ -70,15 +97,26 @@ class ThresholdConfig:
     warning_ratio: float = 0.8  # Warn at 80% of limit
     description: str = ""
     enabled: bool = True
+    # Ratio cut-offs for INFO, WARNING, CRITICAL, EMERGENCY, derived once
+    breakpoints: Tuple[float, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        cuts = [self.warning_ratio * 0.8, self.warning_ratio, 1.0, 1.5]
+        # Higher severities win, so clamp each cut-off to the one above it;
+        # this keeps the tuple sorted for any warning_ratio
+        for i in range(len(cuts) - 2, -1, -1):
+            cuts[i] = min(cuts[i], cuts[i + 1])
+        object.__setattr__(self, "breakpoints", tuple(cuts))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ThresholdEvent:
     """
     An event emitted when a threshold is approached or crossed.
 
     This is the primary output of the detection layer—a structured
-    record that downstream layers can process.
+    record that downstream layers can process. Events are immutable
+    once created, so event_hash always matches the fields it covers.
     """
     metric: MetricType
     value: float
@@ -92,20 +130,31 @@ class ThresholdEvent:
 
     def __post_init__(self):
         if not self.event_hash:
-            self.event_hash = self._compute_hash()
+            object.__setattr__(self, "event_hash", self._compute_hash())
 
     def _compute_hash(self) -> str:
-        """Compute tamper-evident hash for this event."""
-        content = f"{self.metric.value}:{self.value}:{self.threshold}:{self.timestamp}:{self.path}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """Compute tamper-evident hash for this event (64-bit BLAKE2b, 16 hex chars)."""
+        content = ":".join((self.metric.value, str(self.value), str(self.threshold), self.timestamp, self.path))
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result["metric"] = self.metric.value
-        result["severity"] = self.severity.value
-        return result
+        # Listed by hand: asdict() deep-copies every field, which dominates
+        # export time on long event logs. details is shared, not copied.
+        return {
+            "metric": self.metric.value,
+            "value": self.value,
+            "threshold": self.threshold,
+            "severity": self.severity.value,
+            "timestamp": self.timestamp,
+            "path": self.path,
+            "description": self.description,
+            "details": self.details,
+            "event_hash": self.event_hash,
+        }
 
     def to_json(self) -> str:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
 
     @classmethod
@@ -115,6 +164,138 @@ class ThresholdEvent:
         return cls(**data)
 
 
+@lru_cache(maxsize=100)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config, memoized on (path, mtime, size).
+
+    Editing the file changes the key, so stale entries are never served.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one record as a newline-terminated JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode() + b"\n"
+
+
+# Tooling and dependency trees whose contents say nothing about the
+# monitored system; only the directory entry itself is counted
+DEFAULT_PRUNE_DIRS = frozenset({
+    ".git",
+    "node_modules",
+    ".venv",
+    "__pycache__",
+    ".tox",
+    ".mypy_cache",
+    "dist",
+    "build",
+})
+
+# File-name fragments suggesting automated response systems, matched
+# case-insensitively in one regex pass
+REFLEX_INDICATORS = [
+    "reflex",
+    "trigger",
+    "auto_",
+    "_hook",
+    "on_change",
+    "watch",
+    "observer",
+]
+REFLEX_RE = re.compile(
+    "|".join(re.escape(i) for i in REFLEX_INDICATORS), re.IGNORECASE | re.ASCII
+)
+
+# Distinct filename characters above which entropy is computed with numpy
+ENTROPY_VECTOR_MIN_SYMBOLS = 256
+
+# Literal patterns suggesting self-modification, compiled into one
+# alternation so each file is scanned once rather than once per pattern
+SELF_REFERENCE_PATTERNS = [
+    "__file__",  # Python self-reference
+    "os.path.dirname",
+    "pathlib.Path(__file__)",
+    "self.modify",
+    "self.reorganize",
+    "self.update",
+]
+SELF_REFERENCE_RE = re.compile(
+    b"|".join(re.escape(p.encode()) for p in SELF_REFERENCE_PATTERNS)
+)
+# Markers sit near the top of a module (imports, path setup); only this
+# prefix of each .py file is read
+SELF_REFERENCE_READ_BYTES = 16 * 1024
+
+
+@dataclass
+class TreeWalk:
+    """
+    Everything the filesystem metrics need, gathered in one traversal.
+
+    Paths are relative to the scanned root and listed in the same order
+    pathlib's glob would yield them.
+    """
+    entry_count: int = 0      # Entries in scope (files and directories)
+    file_count: int = 0
+    max_depth: int = 0        # Always measured over the full tree
+    file_names: List[str] = field(default_factory=list)   # Entropy input
+    py_files: List[str] = field(default_factory=list)      # Self-reference candidates
+    files: List[str] = field(default_factory=list)         # Reflex candidates
+
+
+# One scandir entry: (name, path, is_dir, descend, is_file)
+DirRow = Tuple[str, str, bool, bool, bool]
+
+
+def _read_dir(
+    dir_path: str,
+    in_scope: bool,
+    prune_dirs: FrozenSet[str] = frozenset()
+) -> Optional[List[DirRow]]:
+    """
+    List one directory, resolving entry types while the DirEntry is at hand.
+
+    Symlinked directories and those named in prune_dirs count as
+    directories but are not descended into. is_file is only resolved for
+    in-scope directories. Returns None if the directory cannot be read.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return None
+
+    rows = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        is_file = False
+        if in_scope:
+            try:
+                is_file = entry.is_file()
+            except OSError:
+                pass
+        descend = is_dir and entry.name not in prune_dirs and not entry.is_symlink()
+        rows.append((entry.name, entry.path, is_dir, descend, is_file))
+    return rows
+
+
+def _has_self_reference(file_path: str) -> bool:
+    """Whether the bounded prefix of a file contains a self-reference marker."""
+    try:
+        with open(file_path, "rb") as f:
+            return SELF_REFERENCE_RE.search(f.read(SELF_REFERENCE_READ_BYTES)) is not None
+    except Exception:
+        return False
+
+
 class ThresholdDetector:
     """
     Core detection engine for monitoring autonomy thresholds.
@@ -125,14 +306,28 @@ class ThresholdDetector:
         events = detector.scan("/path/to/directory")
     """
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        prune_dirs: Optional[Iterable[str]] = None
+    ):
         """
         Initialize the detector.
 
         Args:
             config_path: Path to YAML configuration file (optional)
+            prune_dirs: Directory names whose contents are never scanned
+                (defaults to DEFAULT_PRUNE_DIRS; a config's prune_dirs wins)
         """
         self.thresholds: Dict[MetricType, ThresholdConfig] = {}
+        # Enabled thresholds in evaluation order, with their limits and
+        # breakpoints stacked for _compute_severities; see add_threshold
+        self._severity_configs: List[ThresholdConfig] = []
+        self._severity_limits = None
+        self._severity_breakpoints = None
+        self.prune_dirs: FrozenSet[str] = (
+            DEFAULT_PRUNE_DIRS if prune_dirs is None else frozenset(prune_dirs)
+        )
         self._event_log: List[ThresholdEvent] = []
         self._custom_metrics: Dict[str, Callable] = {}
 
@@ -144,13 +339,21 @@ class ThresholdDetector:
         """Factory method to create detector from config file."""
         return cls(Path(config_path))
 
+    @classmethod
+    def invalidate_config_cache(cls) -> None:
+        """Drop every parsed config so the next load re-reads from disk."""
+        _load_yaml_cached.cache_clear()
+
     def load_config(self, config_path: Path) -> None:
         """Load threshold configuration from YAML file."""
         if not YAML_AVAILABLE:
             raise ImportError("PyYAML required for config loading: pip install pyyaml")
 
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        st = os.stat(config_path)
+        config = _load_yaml_cached(str(config_path), st.st_mtime_ns, st.st_size)
+
+        if "prune_dirs" in config:
+            self.prune_dirs = frozenset(config["prune_dirs"] or ())
 
         for threshold_conf in config.get("thresholds", []):
             metric = MetricType(threshold_conf["metric"])
@@ -177,15 +380,29 @@ class ThresholdDetector:
             warning_ratio=warning_ratio,
             description=description
         )
+        self._rebuild_severity_table()
         logger.debug(f"Added threshold: {metric.value} limit={limit}")
 
-    def scan(self, path: str, recursive: bool = True) -> List[ThresholdEvent]:
+    def _rebuild_severity_table(self) -> None:
+        """Stack enabled thresholds' limits and breakpoints into arrays."""
+        self._severity_configs = [c for c in self.thresholds.values() if c.enabled]
+        if NUMPY_AVAILABLE:
+            self._severity_limits = np.array(
+                [c.limit for c in self._severity_configs], dtype=np.float64
+            )
+            self._severity_breakpoints = np.array(
+                [c.breakpoints for c in self._severity_configs], dtype=np.float64
+            ).reshape(-1, len(SEVERITY_BY_BAND) - 1)
+
+    def scan(self, path: str, recursive: bool = True, threads: int = 1) -> List[ThresholdEvent]:
         """
         Scan a path and check all configured thresholds.
 
         Args:
             path: Directory or file path to scan
             recursive: Whether to scan subdirectories
+            threads: Worker threads for directory listing and file reads;
+                worth raising on network or otherwise high-latency mounts
 
         Returns:
             List of ThresholdEvent objects for any triggered thresholds
@@ -202,7 +419,7 @@ class ThresholdDetector:
         previous_state = self._load_state(path)
 
         # Gather metrics
-        metrics = self._gather_metrics(path, recursive)
+        metrics = self._gather_metrics(path, recursive, threads)
         
         # Compute Growth Rate (Momentum)
         if MetricType.FILE_COUNT in metrics:
@@ -224,19 +441,19 @@ class ThresholdDetector:
                 "timestamp": timestamp
             })
 
-        # Check each threshold
-        for metric_type, config in self.thresholds.items():
-            if not config.enabled:
-                continue
-
-            if metric_type not in metrics:
-                continue
+        # Check every threshold that has a metric, in one batch
+        rows = [
+            i for i, config in enumerate(self._severity_configs)
+            if config.metric in metrics
+        ]
+        values = [metrics[self._severity_configs[i].metric]["value"] for i in rows]
+        severities = self._compute_severities(rows, values)
 
-            value = metrics[metric_type]["value"]
+        for i, value, severity in zip(rows, values, severities):
+            config = self._severity_configs[i]
+            metric_type = config.metric
             details = metrics[metric_type].get("details", {})
 
-            severity = self._compute_severity(value, config)
-
             if severity:
                 event = ThresholdEvent(
                     metric=metric_type,
@@ -257,22 +474,35 @@ class ThresholdDetector:
     def _load_state(self, path: Path) -> Optional[Dict[str, Any]]:
         """Load detector state from target directory."""
         state_path = path / ".threshold_state.json"
-        if not state_path.exists():
-            return None
         try:
             with open(state_path) as f:
                 return json.load(f)
-        except Exception:
+        except Exception:  # Includes a missing file: no prior state
             return None
 
     def _save_state(self, path: Path, state: Dict[str, Any]) -> None:
-        """Save detector state to target directory."""
+        """
+        Save detector state to target directory.
+
+        Serialized up front and written to a temp file that is renamed
+        over the old state, so an interrupted scan never leaves a
+        truncated .threshold_state.json behind.
+        """
         state_path = path / ".threshold_state.json"
+        tmp_path = path / ".threshold_state.json.tmp"
         try:
-            with open(state_path, "w") as f:
-                json.dump(state, f)
+            data = orjson.dumps(state) if ORJSON_AVAILABLE else json.dumps(state).encode()
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, state_path)
         except Exception as e:
             logger.debug(f"Failed to save state: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def _compute_growth_rate(
         self, 
@@ -315,150 +545,276 @@ class ThresholdDetector:
         except ValueError:
             return 0.0
 
-    def _gather_metrics(self, path: Path, recursive: bool) -> Dict[MetricType, Dict[str, Any]]:
+    def _gather_metrics(
+        self,
+        path: Path,
+        recursive: bool,
+        threads: int = 1
+    ) -> Dict[MetricType, Dict[str, Any]]:
         """Gather all metrics for the given path."""
         metrics = {}
 
         if path.is_dir():
-            # File count
-            if recursive:
-                files = list(path.rglob("*"))
-            else:
-                files = list(path.glob("*"))
+            walk = self._walk_tree(path, recursive, threads)
 
-            file_count = len([f for f in files if f.is_file()])
+            # File count
             metrics[MetricType.FILE_COUNT] = {
-                "value": file_count,
+                "value": walk.file_count,
                 "details": {"path": str(path), "recursive": recursive}
             }
 
             # Directory depth
-            max_depth = self._compute_max_depth(path)
             metrics[MetricType.DIRECTORY_DEPTH] = {
-                "value": max_depth,
+                "value": walk.max_depth,
                 "details": {"path": str(path)}
             }
 
             # Entropy (based on filename distribution)
-            entropy = self._compute_filename_entropy(files)
+            entropy = self._compute_filename_entropy(walk.file_names, walk.entry_count)
             metrics[MetricType.ENTROPY] = {
                 "value": entropy,
-                "details": {"sample_size": len(files)}
+                "details": {"sample_size": walk.entry_count}
             }
 
             # Self-reference detection (files that might modify themselves)
-            self_refs = self._detect_self_references(path, recursive)
+            cap = self._emergency_cap(MetricType.SELF_REFERENCE)
+            count, self_refs = self._detect_self_references(path, walk.py_files, threads, cap)
             metrics[MetricType.SELF_REFERENCE] = {
-                "value": len(self_refs),
-                "details": {"files": self_refs[:10]}  # Cap details at 10
+                "value": count,
+                "details": {"files": self_refs}  # First 10 only
             }
+            if count == cap:
+                metrics[MetricType.SELF_REFERENCE]["details"]["capped"] = True
 
             # BTB-specific: reflex patterns
-            reflex_files = self._detect_reflex_patterns(path, recursive)
+            cap = self._emergency_cap(MetricType.REFLEX_PATTERN)
+            count, reflex_files = self._detect_reflex_patterns(walk.files, cap)
             metrics[MetricType.REFLEX_PATTERN] = {
-                "value": len(reflex_files),
-                "details": {"files": reflex_files[:10]}
+                "value": count,
+                "details": {"files": reflex_files}
             }
+            if count == cap:
+                metrics[MetricType.REFLEX_PATTERN]["details"]["capped"] = True
 
         return metrics
 
-    def _compute_max_depth(self, path: Path) -> int:
-        """Compute maximum directory depth from path."""
-        max_depth = 0
-        for item in path.rglob("*"):
-            if item.is_dir():
-                depth = len(item.relative_to(path).parts)
-                max_depth = max(max_depth, depth)
-        return max_depth
+    def _walk_tree(self, path: Path, recursive: bool, threads: int = 1) -> TreeWalk:
+        """
+        Walk the tree once with os.scandir, collecting every metric input.
+
+        Replaces separate rglob/glob passes for file count, depth, entropy,
+        self-references and reflex patterns. Each directory's entries are
+        handled before its subdirectories are entered (pre-order, like
+        pathlib's glob). Symlinked directories and those in self.prune_dirs
+        are not descended into. Depth covers the whole tree even when
+        `recursive` is False.
+
+        With threads > 1 the directories are listed concurrently first
+        (see _list_tree_parallel) and then folded in the same pre-order,
+        so the result is identical to a single-threaded walk.
+        """
+        if threads > 1:
+            listings = self._list_tree_parallel(str(path), recursive, threads)
+            read_dir = lambda dir_path, in_scope: listings.get(dir_path)
+        else:
+            read_dir = lambda dir_path, in_scope: _read_dir(dir_path, in_scope, self.prune_dirs)
+
+        walk = TreeWalk()
+        stack = [("", str(path), 0)]  # (relative prefix, absolute path, depth)
+
+        while stack:
+            prefix, dir_path, depth = stack.pop()
+            in_scope = recursive or depth == 0
+            rows = read_dir(dir_path, in_scope)
+            if rows is None:
+                continue
+            subdirs = []
+
+            for name, entry_path, is_dir, descend, is_file in rows:
+                rel = prefix + name
+                if is_dir:
+                    walk.max_depth = max(walk.max_depth, depth + 1)
+                    if descend:
+                        subdirs.append((rel + os.sep, entry_path, depth + 1))
+
+                if not in_scope:
+                    continue
+
+                walk.entry_count += 1
+                if is_file:
+                    # Type comes from the DirEntry; only regular files are
+                    # ever opened, so directories or FIFOs named *.py are not
+                    if name.endswith(".py"):
+                        walk.py_files.append(rel)
+                    walk.file_count += 1
+                    walk.file_names.append(name)
+                    walk.files.append(rel)
+
+            # Reversed so subdirectories are popped in scandir order
+            stack.extend(reversed(subdirs))
+
+        return walk
+
+    def _list_tree_parallel(
+        self,
+        root: str,
+        recursive: bool,
+        threads: int
+    ) -> Dict[str, Optional[List[DirRow]]]:
+        """
+        List every directory under root on a thread pool.
 
-    def _compute_filename_entropy(self, files: List[Path]) -> float:
+        The walk is bound by scandir latency on network or slow
+        filesystems, so each directory is listed by whichever worker is
+        free; subdirectories are queued as soon as their parent is read.
+        Returns listings keyed by absolute directory path.
+        """
+        listings: Dict[str, Optional[List[DirRow]]] = {}
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            pending = {pool.submit(_read_dir, root, True, self.prune_dirs): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rows = listings[pending.pop(future)] = future.result()
+                    for _, entry_path, _, descend, _ in rows or ():
+                        if descend:
+                            future = pool.submit(_read_dir, entry_path, recursive, self.prune_dirs)
+                            pending[future] = entry_path
+        return listings
+
+    def _compute_filename_entropy(self, file_names: List[str], sample_size: int) -> float:
         """
         Compute Shannon entropy of filename character distribution.
 
         High entropy suggests generated/automated naming.
         Low entropy suggests human-organized structure.
         """
-        if not files:
+        if not sample_size:
             return 0.0
 
-        # Collect all characters from filenames
-        chars = "".join(f.name for f in files if f.is_file())
+        chars = "".join(file_names)
         if not chars:
             return 0.0
-
-        # Compute character frequency
-        freq = Counter(chars)
         total = len(chars)
 
-        # Shannon entropy
-        entropy = 0.0
-        for count in freq.values():
-            p = count / total
-            if p > 0:
-                entropy -= p * math.log2(p)
+        # Character frequency. ASCII names (the common case) are counted
+        # with one bincount over the raw bytes, where byte == character;
+        # anything else falls back to Counter so characters stay whole
+        if NUMPY_AVAILABLE and chars.isascii():
+            hist = np.bincount(np.frombuffer(chars.encode("ascii"), dtype=np.uint8))
+            counts = hist[hist > 0]
+        else:
+            counts = list(Counter(chars).values())
+            # Large alphabets (e.g. non-Latin filenames) are worth converting
+            if NUMPY_AVAILABLE and len(counts) >= ENTROPY_VECTOR_MIN_SYMBOLS:
+                counts = np.array(counts, dtype=np.float64)
+
+        # Shannon entropy; counts already in numpy are reduced there
+        # rather than looped over in Python
+        if isinstance(counts, list):
+            entropy = 0.0
+            for count in counts:
+                p = count / total
+                if p > 0:
+                    entropy -= p * math.log2(p)
+        else:
+            p = counts / total
+            entropy = float(-(p * np.log2(p)).sum())
 
         # Normalize to 0-1 range (max possible is log2(total unique chars))
-        max_entropy = math.log2(len(freq)) if len(freq) > 1 else 1
+        max_entropy = math.log2(len(counts)) if len(counts) > 1 else 1
         return entropy / max_entropy if max_entropy > 0 else 0.0
 
-    def _detect_self_references(self, path: Path, recursive: bool) -> List[str]:
+    def _emergency_cap(self, metric: MetricType) -> Optional[int]:
+        """
+        Smallest count that already rates EMERGENCY for an enabled threshold.
+
+        Counting past it cannot change the event, so detectors stop there.
+        None when the metric has no usable threshold.
+        """
+        config = self.thresholds.get(metric)
+        if config is None or not config.enabled or config.limit <= 0:
+            return None
+        return max(1, math.ceil(config.breakpoints[-1] * config.limit))
+
+    def _detect_self_references(
+        self,
+        path: Path,
+        py_files: List[str],
+        threads: int = 1,
+        cap: Optional[int] = None,
+        max_results: int = 10
+    ) -> Tuple[int, List[str]]:
         """
         Detect files that might modify themselves or their directory.
 
         This is a heuristic—looks for patterns suggesting self-modification.
-        """
-        patterns = [
-            "__file__",  # Python self-reference
-            "os.path.dirname",
-            "pathlib.Path(__file__)",
-            "self.modify",
-            "self.reorganize",
-            "self.update",
-        ]
+        All patterns are matched in one pass over the first
+        SELF_REFERENCE_READ_BYTES of each file (SELF_REFERENCE_RE, on bytes).
+        With threads > 1 the reads run on a thread pool; order is kept.
+        Stops reading once `cap` matches have been found.
 
+        Returns the match count and the first `max_results` matching files.
+        """
+        root = str(path)
+        file_paths = [os.path.join(root, rel) for rel in py_files]
+        pool = None
+        if threads > 1 and len(file_paths) > 1:
+            pool = ThreadPoolExecutor(max_workers=threads)
+            hits = pool.map(_has_self_reference, file_paths)
+        else:
+            hits = map(_has_self_reference, file_paths)
+
+        count = 0
         self_refs = []
-        glob_pattern = "**/*.py" if recursive else "*.py"
-
-        for py_file in path.glob(glob_pattern):
-            try:
-                content = py_file.read_text(errors="ignore")
-                for pattern in patterns:
-                    if pattern in content:
-                        self_refs.append(str(py_file.relative_to(path)))
+        try:
+            for rel, hit in zip(py_files, hits):
+                if hit:
+                    count += 1
+                    if count <= max_results:
+                        self_refs.append(rel)
+                    if count == cap:
                         break
-            except Exception:
-                continue
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
-        return self_refs
+        return count, self_refs
 
-    def _detect_reflex_patterns(self, path: Path, recursive: bool) -> List[str]:
+    def _detect_reflex_patterns(
+        self,
+        files: List[str],
+        cap: Optional[int] = None,
+        max_results: int = 10
+    ) -> Tuple[int, List[str]]:
         """
         Detect BTB-style reflex trigger patterns.
 
         These are files that suggest automated response systems.
+        Stops once `cap` matches have been found. Returns the match count
+        and the first `max_results` matching files.
         """
-        reflex_indicators = [
-            "reflex",
-            "trigger",
-            "auto_",
-            "_hook",
-            "on_change",
-            "watch",
-            "observer",
-        ]
-
+        search = REFLEX_RE.search
+        count = 0
         reflex_files = []
-        glob_pattern = "**/*" if recursive else "*"
-
-        for item in path.glob(glob_pattern):
-            if item.is_file():
-                name_lower = item.name.lower()
-                for indicator in reflex_indicators:
-                    if indicator in name_lower:
-                        reflex_files.append(str(item.relative_to(path)))
-                        break
 
-        return reflex_files
+        for rel in files:
+            start = rel.rfind(os.sep) + 1
+            if rel.isascii():
+                # Match the file name in place: no basename/lower() copies
+                hit = search(rel, start)
+            else:
+                # Non-ASCII case mapping (e.g. the Kelvin sign) must follow
+                # str.lower(), which ASCII-only IGNORECASE would not
+                hit = search(rel[start:].lower())
+            if hit:
+                count += 1
+                if count <= max_results:
+                    reflex_files.append(rel)
+                if count == cap:
+                    break
+
+        return count, reflex_files
 
     def _compute_severity(
         self,
@@ -467,27 +823,53 @@ class ThresholdDetector:
     ) -> Optional[ThresholdSeverity]:
         """Determine severity level based on value vs threshold."""
         ratio = value / config.limit if config.limit > 0 else 0
+        # None below the lowest cut-off: no event
+        return SEVERITY_BY_BAND[bisect_right(config.breakpoints, ratio)]
 
-        if ratio >= 1.5:
-            return ThresholdSeverity.EMERGENCY
-        elif ratio >= 1.0:
-            return ThresholdSeverity.CRITICAL
-        elif ratio >= config.warning_ratio:
-            return ThresholdSeverity.WARNING
-        elif ratio >= config.warning_ratio * 0.8:
-            return ThresholdSeverity.INFO
+    def _compute_severities(
+        self,
+        rows: List[int],
+        values: List[float]
+    ) -> List[Optional[ThresholdSeverity]]:
+        """
+        Severity for each value against self._severity_configs[rows[i]].
 
-        return None  # Below threshold, no event
+        Same result as calling _compute_severity per metric, but with numpy
+        all ratios are compared against the stacked breakpoints at once.
+        """
+        if not NUMPY_AVAILABLE or not rows:
+            return [
+                self._compute_severity(value, self._severity_configs[i])
+                for i, value in zip(rows, values)
+            ]
+
+        limits = self._severity_limits[rows]
+        values_arr = np.asarray(values, dtype=np.float64)
+        ratios = np.divide(values_arr, limits, out=np.zeros_like(values_arr), where=limits > 0)
+        bands = (ratios[:, None] >= self._severity_breakpoints[rows]).sum(axis=1)
+        return [SEVERITY_BY_BAND[band] for band in bands.tolist()]
 
     def get_event_log(self) -> List[ThresholdEvent]:
         """Return all events from this detector instance."""
         return self._event_log.copy()
 
-    def export_events(self, output_path: Path) -> None:
-        """Export event log to JSON file."""
+    def export_events(self, output_path: Path, jsonl: bool = False) -> None:
+        """
+        Export event log to JSON file.
+
+        With jsonl=True, writes one compact event per line instead of an
+        indented list, so the file can later be extended by appending lines.
+        """
         events_data = [e.to_dict() for e in self._event_log]
-        with open(output_path, "w") as f:
-            json.dump(events_data, f, indent=2)
+        with open(output_path, "wb") as f:
+            if jsonl:
+                f.writelines(_dumps_line(d) for d in events_data)
+            elif ORJSON_AVAILABLE:
+                f.write(orjson.dumps(
+                    events_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
+                f.write(json.dumps(events_data, indent=2).encode())
         logger.info(f"Exported {len(events_data)} events to {output_path}")
 
     def register_custom_metric(
@@ -513,10 +895,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Threshold Protocol Detector")
     parser.add_argument("path", help="Path to scan")
     parser.add_argument("--config", "-c", help="YAML configuration file")
-    parser.add_argument("--output", "-o", help="Output JSON file for events")
+    parser.add_argument("--output", "-o", help="Output JSON file for events (.jsonl for one per line)")
     parser.add_argument("--file-limit", type=int, default=100, help="File count threshold")
     parser.add_argument("--depth-limit", type=int, default=10, help="Directory depth threshold")
     parser.add_argument("--no-recursive", action="store_true", help="Don't scan recursively")
+    parser.add_argument("--threads", type=int, default=1, help="Worker threads (helps on network mounts)")
 
     args = parser.parse_args()
 
@@ -535,7 +918,7 @@ if __name__ == "__main__":
     print(f"\nScanning: {args.path}")
     print("=" * 60)
 
-    events = detector.scan(args.path, recursive=not args.no_recursive)
+    events = detector.scan(args.path, recursive=not args.no_recursive, threads=args.threads)
 
     if events:
         print(f"\n{len(events)} threshold event(s) detected:\n")
@@ -556,5 +939,5 @@ if __name__ == "__main__":
 
     # Export if requested
     if args.output:
-        detector.export_events(Path(args.output))
+        detector.export_events(Path(args.output), jsonl=args.output.endswith(".jsonl"))
         print(f"\nEvents exported to: {args.output}")
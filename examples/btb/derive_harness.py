@@ -11,6 +11,7 @@ Capabilities:
 
 Usage:
     python derive_harness.py --scenario entropy_evader --count 50
+    python derive_harness.py --scenario entropy_evader --count 50000 --tmpfs
 """
 
 import os
@@ -18,8 +19,12 @@ import sys
 import shutil
 import argparse
 import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import random
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
 
 # Add project root to path
 sys.path.append(
@@ -40,7 +45,39 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("derive_harness")
 
 
-def generate_entropy_evader(target_dir: Path, count: int):
+# Raw create flags for payload files (O_BINARY keeps Windows from text mode)
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_payload(path: str, payload: bytes):
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def write_payloads(target_dir: Path, items: Iterable[Tuple[str, bytes]], workers: int = 1):
+    """
+    Create each (name, payload) file in target_dir.
+
+    Uses os.open/os.write/os.close directly: no Path object or text
+    wrapper per file, just the three syscalls. With workers > 1 the
+    writes are spread over a thread pool so slow-filesystem latency
+    overlaps; workers=1 keeps creation order deterministic.
+    """
+    base = str(target_dir)
+    paths_payloads = ((os.path.join(base, name), payload) for name, payload in items)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(lambda pp: _write_payload(*pp), paths_payloads):
+                pass
+    else:
+        for path, payload in paths_payloads:
+            _write_payload(path, payload)
+
+
+def generate_entropy_evader(target_dir: Path, count: int, workers: int = 1):
     """
     Generates files with low-entropy names to fool the Sentinel.
     Strategy: Repetitive prefixes, minimal character set.
@@ -48,19 +85,18 @@ def generate_entropy_evader(target_dir: Path, count: int):
     target_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Generating {count} 'Entropy Evader' files in {target_dir}")
 
-    for i in range(count):
-        name = f"data_log_entry_backup_{i:04d}.txt"
-        content = f"Red Team Payload {i}"
-        (target_dir / name).write_text(content)
+    write_payloads(target_dir, (
+        (f"data_log_entry_backup_{i:04d}.txt", b"Red Team Payload %d" % i)
+        for i in range(count)
+    ), workers)
 
 
-def generate_volume_mimicker(target_dir: Path, count: int):
+def generate_volume_mimicker(target_dir: Path, count: int, workers: int = 1):
     """
     Generates files just below thresholds, then bursts.
     """
     target_dir.mkdir(parents=True, exist_ok=True)
-    for i in range(count):
-        (target_dir / f"burst_{i}.dat").write_text("x")
+    write_payloads(target_dir, ((f"burst_{i}.dat", b"x") for i in range(count)), workers)
 
 
 def mock_derive(target_dir: Path):
@@ -71,19 +107,94 @@ def mock_derive(target_dir: Path):
     target_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Simulating 'derive.py' behavior in {target_dir}")
 
-    current = target_dir
-    for i in range(12):
-        current = current / f"cluster_level_{i}"
-        current.mkdir()
-        (current / "neuron.dat").write_text(f"Depth {i}")
+    # One makedirs for the whole chain, then every file relative to target_dir
+    levels = [f"cluster_level_{i}" for i in range(12)]
+    os.makedirs(os.path.join(str(target_dir), *levels), exist_ok=True)
+
+    payloads = []
+    rel = ""
+    for i, level in enumerate(levels):
+        rel = os.path.join(rel, level)
+        payloads.append((os.path.join(rel, "neuron.dat"), b"Depth %d" % i))
+
+    payloads += [
+        ("reflex_monitor.py", b"def on_change(): pass"),
+        ("auto_deploy_hook.sh", b"#!/bin/bash"),
+        ("system_observer_daemon.py", b"while True: pass"),
+        ("recursive_optimizer.py", b"self.reorganize()"),
+    ]
+    write_payloads(target_dir, payloads)
+
 
-    (target_dir / "reflex_monitor.py").write_text("def on_change(): pass")
-    (target_dir / "auto_deploy_hook.sh").write_text("#!/bin/bash")
-    (target_dir / "system_observer_daemon.py").write_text("while True: pass")
-    (target_dir / "recursive_optimizer.py").write_text("self.reorganize()")
+FLAT_SCENARIOS = frozenset({"entropy_evader", "volume_mimicker"})
 
 
-def live_fire_derive(target_dir: Path, count: int):
+def fast_rmtree_flat(path: str, ignore_errors: bool = True):
+    """
+    Delete a directory whose entries are (almost) all plain files.
+
+    Every file is unlinked relative to one open directory fd, so the kernel
+    does not re-resolve the parent path per file. Any subdirectory found is
+    handed to shutil.rmtree. Falls back to shutil.rmtree outright where
+    dir_fd is unsupported.
+    """
+    if os.unlink not in os.supports_dir_fd:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+    try:
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=ignore_errors)
+                    else:
+                        os.unlink(entry.name, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+        os.rmdir(path)
+    except OSError:
+        if not ignore_errors:
+            raise
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def remove_in_background(
+    path: Path, flat: bool = False
+) -> Optional[multiprocessing.Process]:
+    """
+    Delete a directory tree without waiting for it.
+
+    The tree is first renamed to a unique sibling (a single rename), so the
+    original name is free again at once; the delete then runs in a child
+    process. The child is non-daemonic, so interpreter exit still joins it.
+    If the rename fails the tree is deleted synchronously and None is
+    returned, so a caller about to recreate the directory never races a
+    background delete of it.
+    Pass flat=True for trees known to hold only files (fast_rmtree_flat).
+    """
+    remove = fast_rmtree_flat if flat else shutil.rmtree
+    doomed = path.with_name(f".{path.name}.rm-{os.getpid()}-{os.urandom(4).hex()}")
+    try:
+        os.rename(path, doomed)
+    except OSError:
+        remove(str(path), ignore_errors=False)
+        return None
+    proc = multiprocessing.Process(
+        target=remove,
+        args=(str(doomed),),
+        kwargs={"ignore_errors": True},
+    )
+    proc.start()
+    return proc
+
+
+REGIONS = ("us-east", "us-west", "eu-central")
+SENSORS = ("lidar", "thermal", "rgb")
+CHAOS_DATE = "2026-01-01"
+
+
+def live_fire_derive(target_dir: Path, count: int, workers: int = 1):
     """
     The CATALYST.
     Uses the real Coherence Engine to derive structure and reorganize files.
@@ -93,24 +204,37 @@ def live_fire_derive(target_dir: Path, count: int):
         f"LIVE FIRE: Generating {count} chaos files and engaging Coherence Engine..."
     )
 
-    chaos_files = []
-    for i in range(count):
-        region = random.choice(["us-east", "us-west", "eu-central"])
-        sensor = random.choice(["lidar", "thermal", "rgb"])
-        filename = f"{region}_{sensor}_2026-01-01_{i}.parquet"
-        path = target_dir / filename
-        path.write_text(f"Data {i}")
-        chaos_files.append(str(path))
-
+    # Draw every file's region and sensor up front in two vectorized calls
+    rng = np.random.default_rng()
+    region_idx = rng.integers(0, len(REGIONS), size=count).tolist()
+    sensor_idx = rng.integers(0, len(SENSORS), size=count).tolist()
+
+    # Only len(REGIONS) * len(SENSORS) distinct name and path prefixes exist;
+    # format them once and just append each file's tail
+    combos = [(r, s) for r in REGIONS for s in SENSORS]
+    name_prefix = [f"{r}_{s}_{CHAOS_DATE}_" for r, s in combos]
+    path_prefix = [f"data/region={r}/sensor={s}/date={CHAOS_DATE}/" for r, s in combos]
+
+    # (region, sensor, date, tail) per file: the four "_"-separated fields of
+    # its name, kept so nothing below has to split the name back apart
+    chaos_meta = []
+    payloads = []
     hypothetical_paths = []
-    for f in chaos_files:
-        name = Path(f).name
-        parts = name.split("_")
-        h_path = f"data/region={parts[0]}/sensor={parts[1]}/date={parts[2]}/{parts[3]}"
-        hypothetical_paths.append(h_path)
-
-    schema_result = Coherence.derive(hypothetical_paths)
-    logger.info(f"Derived Schema Structure: {list(schema_result['_structure'].keys())}")
+    for i, (ri, si) in enumerate(zip(region_idx, sensor_idx)):
+        combo = ri * len(SENSORS) + si
+        tail = str(i) + ".parquet"
+        chaos_meta.append((REGIONS[ri], SENSORS[si], CHAOS_DATE, tail))
+        payloads.append((name_prefix[combo] + tail, b"Data %d" % i))
+        hypothetical_paths.append(path_prefix[combo] + tail)
+    write_payloads(target_dir, payloads, workers)
+
+    # The derived schema is only logged; the engine below runs on the
+    # hand-written one. SKIP_DERIVE=1 drops the inference pass entirely.
+    if os.environ.get("SKIP_DERIVE"):
+        logger.info("Derived Schema Structure: skipped (SKIP_DERIVE set)")
+    else:
+        schema_result = Coherence.derive(hypothetical_paths)
+        logger.info(f"Derived Schema Structure: {list(schema_result['_structure'].keys())}")
 
     derived_schema = {
         "region": {
@@ -140,11 +264,18 @@ def live_fire_derive(target_dir: Path, count: int):
 
     engine = Coherence(derived_schema, root=str(target_dir / "organized"))
 
-    for f in chaos_files:
-        name = Path(f).name
-        parts = name.split("_")
-        packet = {"region": parts[0], "sensor": parts[1], "id": parts[3]}
-        engine.transmit(packet, dry_run=False)
+    packets = [
+        {"region": region, "sensor": sensor, "id": tail}
+        for region, sensor, _, tail in chaos_meta
+    ]
+    # Engines that provide transmit_many take the whole batch in one call
+    # (one mkdir per destination); older ones get the per-packet loop.
+    transmit_many = getattr(engine, "transmit_many", None)
+    if transmit_many is not None:
+        transmit_many(packets, dry_run=False)
+    else:
+        for packet in packets:
+            engine.transmit(packet, dry_run=False)
 
     logger.info("Reorganization Complete. Chaos has become Order.")
 
@@ -158,21 +289,46 @@ def main():
     )
     parser.add_argument("--count", type=int, default=100)
     parser.add_argument("--output-dir", default="temp_live_fire_zone")
+    parser.add_argument(
+        "--parallel-io",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Write generated files with N threads (default 1: serial, reproducible order)",
+    )
+    parser.add_argument(
+        "--tmpfs",
+        action="store_true",
+        help="Build the zone under /dev/shm (tmpfs). Faster for large counts; "
+        "affects timing only, the detector walks the tree the same way",
+    )
 
     args = parser.parse_args()
 
     target_path = Path(args.output_dir)
+    if args.tmpfs:
+        shm = Path("/dev/shm")
+        if not shm.is_dir():
+            parser.error("--tmpfs needs /dev/shm (Linux tmpfs)")
+        name = target_path.name
+        if name in ("", ".", ".."):
+            parser.error("--tmpfs needs --output-dir to end in a directory name")
+        target_path = shm / name
+        # Never let cleanup touch /dev/shm itself or anything outside it
+        # (e.g. a symlinked zone name)
+        if target_path.resolve().parent != shm.resolve():
+            parser.error(f"--tmpfs target {target_path} does not resolve inside {shm}")
     if target_path.exists():
-        shutil.rmtree(target_path)
+        remove_in_background(target_path)
 
     if args.scenario == "entropy_evader":
-        generate_entropy_evader(target_path, args.count)
+        generate_entropy_evader(target_path, args.count, args.parallel_io)
     elif args.scenario == "volume_mimicker":
-        generate_volume_mimicker(target_path, args.count)
+        generate_volume_mimicker(target_path, args.count, args.parallel_io)
     elif args.scenario == "mock_derive":
         mock_derive(target_path)
     elif args.scenario == "live_fire":
-        live_fire_derive(target_path, args.count)
+        live_fire_derive(target_path, args.count, args.parallel_io)
 
     circuit = ThresholdCircuit(
         config_path="detection/configs/default.yaml", auto_approve=True
@@ -196,10 +352,10 @@ def main():
     print("-" * 30)
     print("Audit Summary:")
     print(result.summary)
-    print("=" * 50 + "\n")
+    print("=" * 50 + "\n", flush=True)
 
     if target_path.exists():
-        shutil.rmtree(target_path)
+        remove_in_background(target_path, flat=args.scenario in FLAT_SCENARIOS)
 
 
 if __name__ == "__main__":
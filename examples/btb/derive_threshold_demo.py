@@ -291,12 +291,21 @@ if __name__ == "__main__":
         print("   Created derive.py stub with self-reference patterns")
 
     def _measure_depth(self, path: Path) -> int:
-        """Measure actual directory depth."""
+        """Measure actual directory depth (carried as an int, no path splitting)."""
         max_depth = 0
-        for item in path.rglob("*"):
-            if item.is_dir():
-                depth = len(item.relative_to(path).parts)
-                max_depth = max(max_depth, depth)
+        stack = [(str(path), 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    max_depth = max(max_depth, depth + 1)
+                    if not entry.is_symlink():
+                        stack.append((entry.path, depth + 1))
         return max_depth
 
     def cleanup(self) -> None:
@@ -82,6 +82,18 @@ class TestThresholdDetector:
                 # 70/100 = 0.7 which is >= 0.64 (warning_ratio * 0.8) but < 0.8
                 assert file_events[0].severity == ThresholdSeverity.INFO
 
+    def test_severity_band_edges(self):
+        """Each breakpoint belongs to the higher severity band."""
+        detector = ThresholdDetector()
+        detector.add_threshold(MetricType.FILE_COUNT, limit=100, warning_ratio=0.5)
+        config = detector.thresholds[MetricType.FILE_COUNT]
+
+        assert detector._compute_severity(39, config) is None
+        assert detector._compute_severity(40, config) == ThresholdSeverity.INFO
+        assert detector._compute_severity(50, config) == ThresholdSeverity.WARNING
+        assert detector._compute_severity(100, config) == ThresholdSeverity.CRITICAL
+        assert detector._compute_severity(150, config) == ThresholdSeverity.EMERGENCY
+
     def test_no_event_below_threshold(self):
         """No events generated when well below threshold."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -111,7 +123,7 @@ class TestThresholdDetector:
 
             for event in events:
                 assert event.event_hash
-                assert len(event.event_hash) == 16  # SHA256 truncated to 16 chars
+                assert len(event.event_hash) == 16  # 64-bit BLAKE2b digest as hex
 
     def test_event_serialization(self):
         """Events can be serialized to dict/JSON."""
@@ -135,6 +147,46 @@ class TestThresholdDetector:
         json_str = event.to_json()
         assert "file_count" in json_str
 
+    def test_event_is_immutable(self):
+        """Events cannot be altered after their hash is computed."""
+        from dataclasses import FrozenInstanceError
+
+        event = ThresholdEvent(
+            metric=MetricType.FILE_COUNT,
+            value=100,
+            threshold=80,
+            severity=ThresholdSeverity.CRITICAL,
+            timestamp="2026-01-15T00:00:00",
+            path="/test/path",
+            description="Test event"
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            event.value = 1
+
+    def test_export_events_jsonl(self):
+        """Events export as a JSON list or as one JSON object per line."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(50):
+                Path(tmpdir, f"file_{i}.txt").write_text("x")
+
+            detector = ThresholdDetector()
+            detector.add_threshold(MetricType.FILE_COUNT, limit=40)
+            events = detector.scan(tmpdir)
+
+            out_dir = Path(tmpdir, "out")
+            out_dir.mkdir()
+            detector.export_events(out_dir / "events.json")
+            detector.export_events(out_dir / "events.jsonl", jsonl=True)
+
+            as_list = json.loads((out_dir / "events.json").read_text())
+            lines = (out_dir / "events.jsonl").read_text().splitlines()
+
+            assert as_list == [e.to_dict() for e in events]
+            assert [json.loads(line) for line in lines] == as_list
+
 
 class TestDirectoryDepth:
     """Test directory depth metric."""
@@ -208,6 +260,126 @@ def self_update():
             assert len(self_ref_events) > 0
             assert self_ref_events[0].value >= 1
 
+    def test_counting_stops_at_emergency(self):
+        """Matches past 1.5x the limit are not counted; severity is unaffected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(6):
+                Path(tmpdir, f"mod_{i}.py").write_text("HERE = __file__\n")
+
+            detector = ThresholdDetector()
+            detector.add_threshold(MetricType.SELF_REFERENCE, limit=2)
+
+            events = detector.scan(tmpdir)
+            self_ref_events = [e for e in events if e.metric == MetricType.SELF_REFERENCE]
+
+            assert self_ref_events[0].value == 3
+            assert self_ref_events[0].severity == ThresholdSeverity.EMERGENCY
+            assert self_ref_events[0].details["capped"] is True
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_non_regular_py_entries_are_not_opened(self):
+        """A FIFO named *.py is skipped instead of blocking the scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.mkfifo(Path(tmpdir, "pipe.py"))
+            Path(tmpdir, "real.py").write_text("HERE = __file__\n")
+
+            detector = ThresholdDetector()
+            metrics = detector._gather_metrics(Path(tmpdir), recursive=True)
+
+            assert metrics[MetricType.SELF_REFERENCE]["details"]["files"] == ["real.py"]
+
+    def test_only_file_prefix_is_scanned(self):
+        """Markers past the bounded read prefix are not reported."""
+        from detection.threshold_detector import SELF_REFERENCE_READ_BYTES
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "early.py").write_text("HERE = __file__\n")
+            padding = "#" * SELF_REFERENCE_READ_BYTES
+            Path(tmpdir, "late.py").write_text(padding + "\nHERE = __file__\n")
+
+            detector = ThresholdDetector()
+            metrics = detector._gather_metrics(Path(tmpdir), recursive=True)
+
+            assert metrics[MetricType.SELF_REFERENCE]["details"]["files"] == ["early.py"]
+
+
+class TestTreeWalk:
+    """Test the single-pass traversal feeding the filesystem metrics."""
+
+    def test_recursive_flag_scopes_counts_not_depth(self):
+        """Non-recursive scans count top-level entries but still measure full depth."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "on_change_hook.sh").write_text("x")
+            nested = Path(tmpdir, "a", "b")
+            nested.mkdir(parents=True)
+            Path(nested, "reflex_trigger.py").write_text("x")
+            Path(nested, "plain.txt").write_text("x")
+
+            detector = ThresholdDetector()
+            recursive = detector._gather_metrics(Path(tmpdir), recursive=True)
+            flat = detector._gather_metrics(Path(tmpdir), recursive=False)
+
+            assert recursive[MetricType.FILE_COUNT]["value"] == 3
+            assert flat[MetricType.FILE_COUNT]["value"] == 1
+            assert recursive[MetricType.DIRECTORY_DEPTH]["value"] == 2
+            assert flat[MetricType.DIRECTORY_DEPTH]["value"] == 2
+            assert recursive[MetricType.REFLEX_PATTERN]["details"]["files"] == [
+                "on_change_hook.sh",
+                os.path.join("a", "b", "reflex_trigger.py"),
+            ]
+            assert flat[MetricType.REFLEX_PATTERN]["value"] == 1
+
+    def test_pruned_directories_are_not_entered(self):
+        """Contents of .git/node_modules-style trees are skipped unless pruning is disabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "main.py").write_text("x")
+            deps = Path(tmpdir, "node_modules", "pkg")
+            deps.mkdir(parents=True)
+            Path(deps, "index.js").write_text("x")
+
+            pruned = ThresholdDetector()._gather_metrics(Path(tmpdir), recursive=True)
+            full = ThresholdDetector(prune_dirs=())._gather_metrics(Path(tmpdir), recursive=True)
+
+            assert pruned[MetricType.FILE_COUNT]["value"] == 1
+            assert pruned[MetricType.DIRECTORY_DEPTH]["value"] == 1
+            assert full[MetricType.FILE_COUNT]["value"] == 2
+            assert full[MetricType.DIRECTORY_DEPTH]["value"] == 2
+
+    def test_threaded_walk_matches_serial(self):
+        """Listing directories on a thread pool yields the same metrics in the same order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for d in range(6):
+                sub = Path(tmpdir, f"dir_{d}", "inner")
+                sub.mkdir(parents=True)
+                Path(sub.parent, f"watch_{d}.py").write_text("HERE = __file__\n")
+                Path(sub, f"trigger_{d}.txt").write_text("x")
+
+            detector = ThresholdDetector()
+            for recursive in (True, False):
+                serial = detector._gather_metrics(Path(tmpdir), recursive)
+                threaded = detector._gather_metrics(Path(tmpdir), recursive, threads=4)
+                assert threaded == serial
+
+
+class TestStatePersistence:
+    """Test the momentum state saved between scans."""
+
+    def test_state_replaced_without_temp_file(self):
+        """Each scan leaves one complete state file and no temp file."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(5):
+                Path(tmpdir, f"file_{i}.txt").write_text("x")
+
+            detector = ThresholdDetector()
+            detector.scan(tmpdir)
+            detector.scan(tmpdir)
+
+            state = json.loads(Path(tmpdir, ".threshold_state.json").read_text())
+            assert state["file_count"] == 6  # Includes the first scan's state file
+            assert not Path(tmpdir, ".threshold_state.json.tmp").exists()
+
 
 class TestConfigLoading:
     """Test YAML configuration loading."""
@@ -222,6 +394,22 @@ class TestConfigLoading:
             assert len(detector.thresholds) > 0
             assert MetricType.FILE_COUNT in detector.thresholds
 
+    def test_edited_config_is_reloaded(self):
+        """Cached configs are keyed on mtime/size, so edits are picked up."""
+        pytest.importorskip("yaml")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir, "thresholds.yaml")
+            config_path.write_text("thresholds:\n  - metric: file_count\n    limit: 10\n")
+            first = ThresholdDetector.from_config(str(config_path))
+
+            config_path.write_text("thresholds:\n  - metric: file_count\n    limit: 250\n")
+            os.utime(config_path, ns=(0, 10**18))
+            second = ThresholdDetector.from_config(str(config_path))
+
+            assert first.thresholds[MetricType.FILE_COUNT].limit == 10
+            assert second.thresholds[MetricType.FILE_COUNT].limit == 250
+
 
 # Run tests if executed directly
 if __name__ == "__main__":